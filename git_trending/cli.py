@@ -2,12 +2,17 @@
 Command Line Interface for Git Trending CLI Tool
 """
 
-import argparse
+import functools
 import sys
-from typing import List, Dict, Callable
-from .scraper import GitHubTrendingScraper
-from .display import DisplayManager
-from .export import ExportManager
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, ClassVar, List, Dict, Callable, Optional
+from . import __version__
+
+if TYPE_CHECKING:
+    import argparse
+
+
+_DETAILS_HEADER = "\n".join(["", "=" * 80, "📦 Repository Details", "=" * 80, ""])
 
 
 class GitHubTrendingCLI:
@@ -16,12 +21,48 @@ class GitHubTrendingCLI:
     # Constants
     VALID_RANGES = ['daily', 'weekly', 'monthly']
     DEFAULT_RANGE = 'daily'
+    VALID_FORMATS = ['csv', 'json']
+    DEFAULT_FORMAT = 'csv'
+    
+    # Option spellings understood by the fast argument parser
+    FAST_VALUE_OPTIONS = {'-r': 'range', '--range': 'range', '-f': 'format', '--format': 'format'}
+    FAST_FLAG_OPTIONS = {'-e': 'export', '--export': 'export'}
+    
+    # Usage examples for the help text
+    USAGE_EXAMPLES: ClassVar[str] = """
+Examples:
+  git-trending                    # Show today's trending repos
+  git-trending --range weekly     # Show this week's trending repos
+  git-trending --range monthly    # Show this month's trending repos
+  
+  # Export examples
+  git-trending --export           # Export today's trending repos to CSV
+  git-trending -e -f json         # Export to JSON format
+  git-trending -r weekly -e       # Export weekly trending to CSV
+  git-trending -r monthly -e -f json  # Export monthly trending to JSON
+            """
     
     def __init__(self):
-        self.scraper = GitHubTrendingScraper()
-        self.display = DisplayManager()
-        self.export_manager = ExportManager()
         self.current_repos: List[Dict[str, str]] = []
+        # Fetched repositories per date range, reused within the session
+        self._repo_cache: Dict[str, List[Dict[str, str]]] = {}
+    
+    # Heavy dependencies are imported and constructed on first use so that
+    # argument parsing (and --help) does not pay for them.
+    @functools.cached_property
+    def scraper(self):
+        from .scraper import GitHubTrendingScraper
+        return GitHubTrendingScraper()
+    
+    @functools.cached_property
+    def display(self):
+        from .display import DisplayManager
+        return DisplayManager()
+    
+    @functools.cached_property
+    def export_manager(self):
+        from .export import ExportManager
+        return ExportManager()
     
     def run(self):
         """Main entry point for the CLI application."""
@@ -35,19 +76,66 @@ class GitHubTrendingCLI:
         else:
             self._display_repositories(args.range)
     
-    def _parse_arguments(self) -> argparse.Namespace:
+    def _parse_arguments(self) -> "argparse.Namespace | SimpleNamespace":
         """Parse command line arguments."""
-        parser = self._create_parser()
+        args = self._fast_parse_arguments(sys.argv[1:])
+        if args is not None:
+            return args
+        
+        # Help, errors and less common spellings go through argparse
+        parser = self._create_parser(needs_help=self._help_requested(sys.argv[1:]))
         return parser.parse_args()
     
+    def _fast_parse_arguments(self, argv: List[str]) -> Optional[SimpleNamespace]:
+        """Parse the common option spellings without argparse. Returns None to fall back."""
+        values = {'range': self.DEFAULT_RANGE, 'export': False, 'format': self.DEFAULT_FORMAT}
+        
+        i = 0
+        while i < len(argv):
+            arg = argv[i]
+            option, _, inline_value = arg.partition('=')
+            
+            if arg in self.FAST_FLAG_OPTIONS:
+                values[self.FAST_FLAG_OPTIONS[arg]] = True
+            elif option in self.FAST_VALUE_OPTIONS and inline_value and option.startswith('--'):
+                values[self.FAST_VALUE_OPTIONS[option]] = inline_value
+            elif arg in self.FAST_VALUE_OPTIONS and i + 1 < len(argv):
+                values[self.FAST_VALUE_OPTIONS[arg]] = argv[i + 1]
+                i += 1
+            else:
+                return None
+            i += 1
+        
+        # Let argparse report invalid choices
+        if values['range'] not in self.VALID_RANGES or values['format'] not in self.VALID_FORMATS:
+            return None
+        return SimpleNamespace(**values)
+    
+    @staticmethod
+    def _help_requested(argv: List[str]) -> bool:
+        """Check whether the arguments ask for help (including abbreviations and short-flag clusters)."""
+        for arg in argv:
+            if arg == '--':
+                break
+            if arg.startswith('--h') and '--help'.startswith(arg):
+                return True
+            if arg.startswith('-') and not arg.startswith('--') and 'h' in arg[1:]:
+                return True
+        return False
+    
     def _fetch_repositories(self, date_range: str) -> bool:
         """Fetch trending repositories. Returns True if successful."""
+        if date_range in self._repo_cache:
+            self.current_repos = self._repo_cache[date_range]
+            return True
+        
         print("🔍 Fetching trending repositories...")
         self.current_repos = self.scraper.get_trending_repos(date_range)
         
         if not self.current_repos:
             print("❌ No repositories found or error occurred.")
             return False
+        self._repo_cache[date_range] = self.current_repos
         return True
     
     def _display_repositories(self, date_range: str):
@@ -71,12 +159,26 @@ class GitHubTrendingCLI:
             print(f"❌ Export failed: {e}")
             sys.exit(1)
     
-    def _create_parser(self) -> argparse.ArgumentParser:
-        """Create and configure the argument parser."""
+    def _create_parser(self, needs_help: bool = True) -> "argparse.ArgumentParser":
+        """Create and configure the argument parser (help epilog only when needed)."""
+        import argparse
+        
+        help_kwargs = {}
+        if needs_help:
+            help_kwargs = {
+                'formatter_class': argparse.RawDescriptionHelpFormatter,
+                'epilog': self.USAGE_EXAMPLES
+            }
+        
         parser = argparse.ArgumentParser(
             description="Browse GitHub trending repositories from the command line",
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog=self._get_usage_examples()
+            **help_kwargs
+        )
+        
+        parser.add_argument(
+            '--version', '-V',
+            action='version',
+            version=f'%(prog)s {__version__}'
         )
         
         parser.add_argument(
@@ -94,40 +196,23 @@ class GitHubTrendingCLI:
         
         parser.add_argument(
             '--format', '-f',
-            choices=['csv', 'json'],
-            default='csv',
+            choices=self.VALID_FORMATS,
+            default=self.DEFAULT_FORMAT,
             help='Export format: csv or json (default: csv)'
         )
         
         return parser
     
-    def _get_usage_examples(self) -> str:
-        """Get usage examples for the help text."""
-        return """
-Examples:
-  git-trending                    # Show today's trending repos
-  git-trending --range weekly     # Show this week's trending repos
-  git-trending --range monthly    # Show this month's trending repos
-  
-  # Export examples
-  git-trending --export           # Export today's trending repos to CSV
-  git-trending -e -f json         # Export to JSON format
-  git-trending -r weekly -e       # Export weekly trending to CSV
-  git-trending -r monthly -e -f json  # Export monthly trending to JSON
-            """
-    
-    def _handle_repository_selection(self, repo_index: int, displayed_repos: List[Dict[str, str]]):
+    def _handle_repository_selection(self, repo_index: int, repos: List[Dict[str, str]]):
         """Handle repository selection from the scrolling interface."""
-        repo = displayed_repos[repo_index]
+        repo = repos[repo_index]
         
         self._show_repository_details(repo)
         self._show_repository_readme(repo)
     
     def _show_repository_details(self, repo: Dict[str, str]):
         """Display repository details header."""
-        print("\n" + "="*80)
-        print("📦 Repository Details")
-        print("="*80)
+        sys.stdout.write(_DETAILS_HEADER)
         self.display.show_repository_header(repo)
     
     def _show_repository_readme(self, repo: Dict[str, str]):
@@ -3,15 +3,249 @@ Display Manager for GitHub Trending CLI Tool
 Handles all output formatting and display logic.
 """
 
-import shutil
+import bisect
+import functools
+import os
+import queue
+import signal
 import sys
+import threading
 import tty
 import termios
-from typing import List, Dict, Callable, Optional
-import re
+from types import MappingProxyType
+from typing import List, Dict, Callable, NamedTuple, Optional
 from rich.console import Console
-from rich.markdown import Markdown
-from rich.text import Text
+from rich.text import Span, Text
+
+
+_COMMA_STRIP = str.maketrans('', '', ',')
+_UNKNOWN_EMOJI = '❓'
+
+
+class _LanguageEmojis(dict):
+    """Language to emoji mapping that answers unlisted languages with the unknown emoji."""
+    
+    def __missing__(self, language: str) -> str:
+        return _UNKNOWN_EMOJI
+
+
+# Language emoji mapping (read-only, interned keys)
+_LANGUAGE_EMOJIS = MappingProxyType(_LanguageEmojis({sys.intern(language): emoji for language, emoji in {
+    'Python': '🐍', 'JavaScript': '🟨', 'TypeScript': '🔷', 'Java': '☕',
+    'C++': '⚡', 'C': '🔧', 'C#': '💜', 'Go': '🐹', 'Rust': '🦀',
+    'PHP': '🐘', 'Ruby': '💎', 'Swift': '🍎', 'Kotlin': '🟣',
+    'Dart': '🎯', 'Shell': '🐚', 'HTML': '🌐', 'CSS': '🎨',
+    'Vue': '💚', 'React': '⚛️', 'Angular': '🅰️', 'Jupyter Notebook': '📓',
+    'Lua': '🌙', 'R': '📊', 'Scala': '🔺', 'Perl': '🐪',
+    'Haskell': '🎓', 'Clojure': '🔮', 'Elixir': '💧', 'Erlang': '📡',
+    'Unknown': _UNKNOWN_EMOJI
+}.items()}))
+
+# SGR sequences for the few fixed-style strings written without Rich
+_SGR_BOLD = "\033[1m"
+_SGR_DIM = "\033[2m"
+_SGR_RESET = "\033[0m"
+
+# Trending indicators based on stars in the period: _TIERS[i] applies from
+# _TIER_THRESHOLDS[i - 1] stars up, _TIERS[0] below the first threshold
+_TIER_THRESHOLDS = (10, 50, 100)
+_TIERS = (("", "dim"), ("📈", "green"), ("🚀", "yellow"), ("🔥", "red"))
+
+# Repository details block shown above a README
+_REPO_HEADER_TEMPLATE = (
+    "📦 Name: {name}\n"
+    "🔗 URL: {url}\n"
+    "🏷️  Language: {language}\n"
+    "⭐ Stars: {stars} (+{stars_period} this period)\n"
+    "📝 Description: {description}\n"
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_number(number_str: str) -> Optional[int]:
+    """Parse a number string that may contain commas; None if it is not a number."""
+    try:
+        # The scraper already strips commas, so plain digits are the common case
+        if number_str.isdecimal():
+            return int(number_str)
+        return int(number_str.translate(_COMMA_STRIP) or '0')
+    except (ValueError, AttributeError):
+        return None
+
+
+def _format_parsed_number(num: Optional[int], number_str: str) -> str:
+    """Format an already parsed number with commas, falling back to the raw string."""
+    if num is None:
+        return number_str or "0"
+    return f"{num:,}"
+
+
+def _trending_tier(stars_num: Optional[int]) -> tuple[str, str]:
+    """Get trending indicator and style for an already parsed star count."""
+    if stars_num is None:
+        return "", "dim"
+    return _TIERS[bisect.bisect_right(_TIER_THRESHOLDS, stars_num)]
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_number(number_str: str) -> str:
+    """Format number string with commas for better readability."""
+    return _format_parsed_number(_parse_number(number_str), number_str)
+
+
+@functools.lru_cache(maxsize=512)
+def _clean_repo_name(name: str) -> str:
+    """Clean up repository name by removing extra whitespace."""
+    return ' '.join(name.split())
+
+
+@functools.lru_cache(maxsize=1024)
+def _wrap_words(text: str, width: int) -> tuple[str, ...]:
+    """Greedily wrap text at whitespace to lines of at most width characters.
+    
+    Words longer than width are kept whole on their own line, never broken.
+    """
+    lines = []
+    current = []
+    current_len = -1  # Accounts for the missing space before the first word
+    for word in text.split():
+        if current and current_len + 1 + len(word) > width:
+            lines.append(' '.join(current))
+            current = []
+            current_len = -1
+        current.append(word)
+        current_len += 1 + len(word)
+    if current:
+        lines.append(' '.join(current))
+    return tuple(lines)
+
+
+class _RepoFields(NamedTuple):
+    """Display fields derived once from a scraped repository dict."""
+    name: str
+    lang_emoji: str
+    stars: str
+    stars_period: str
+    trend_indicator: str
+    trend_style: str
+
+
+class _KeyReader:
+    """Reads keys from stdin, holding cbreak mode for the whole session."""
+    
+    BACKSPACE_KEYS = ('\x7f', '\b')
+    
+    def __init__(self):
+        self._depth = 0
+        self._old_settings = None
+        self._history: List[str] = []  # Lines entered at read_line prompts
+    
+    def __enter__(self):
+        if self._depth == 0 and sys.stdin.isatty():
+            fd = sys.stdin.fileno()
+            self._old_settings = termios.tcgetattr(fd)
+            tty.setcbreak(fd)
+        self._depth += 1
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self._depth -= 1
+        if self._depth == 0 and self._old_settings is not None:
+            termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, self._old_settings)
+            self._old_settings = None
+        return False
+    
+    def read_key(self) -> str:
+        """Read a single keypress, mapping navigation keys to names."""
+        try:
+            # Check if we're in a terminal that supports raw mode
+            if not sys.stdin.isatty():
+                # Fallback for non-interactive environments
+                return 'quit'
+            
+            key = sys.stdin.read(1)
+            
+            # Handle arrow keys (they come as escape sequences)
+            if key == '\x1b':  # ESC sequence
+                key += sys.stdin.read(2)
+                if key == '\x1b[A':  # Up arrow
+                    return 'up'
+                elif key == '\x1b[B':  # Down arrow
+                    return 'down'
+                elif key[-1:].isdigit():
+                    key += sys.stdin.read(1)  # Trailing '~' of Page Up/Down
+                    if key == '\x1b[5~':  # Page Up
+                        return 'page_up'
+                    elif key == '\x1b[6~':  # Page Down
+                        return 'page_down'
+            elif key == '\r' or key == '\n':  # Enter
+                return 'enter'
+            elif key == 'q' or key == 'Q':
+                return 'quit'
+            elif key == '\x03':  # Ctrl+C
+                return 'quit'
+            
+            return key
+        except:
+            # Fallback for environments that don't support raw terminal input
+            return 'quit'
+    
+    def read_line(self, prompt: str) -> str:
+        """Read a line of input, echoing it; 'q' on an empty line returns immediately.
+        
+        Up/Down recall previously entered lines.
+        """
+        if not sys.stdin.isatty():
+            return input(prompt)
+        
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        
+        buffer = []
+        history_pos = len(self._history)
+        while True:
+            key = sys.stdin.read(1)
+            if key == '':
+                # End of input or terminal hangup, raised like input() does
+                raise EOFError
+            elif key in ('\r', '\n'):
+                break
+            elif key == '\x1b':  # ESC sequence
+                key += sys.stdin.read(2)
+                if key[-1:].isdigit():
+                    sys.stdin.read(1)  # Trailing '~', not used for line input
+                elif key == '\x1b[A' and history_pos > 0:
+                    history_pos -= 1
+                    self._replace_line(buffer, self._history[history_pos])
+                elif key == '\x1b[B' and history_pos < len(self._history):
+                    history_pos += 1
+                    self._replace_line(buffer, self._history[history_pos] if history_pos < len(self._history) else '')
+            elif key in self.BACKSPACE_KEYS:
+                if buffer:
+                    buffer.pop()
+                    sys.stdout.write('\b \b')
+            elif key in ('q', 'Q') and not buffer:
+                buffer.append(key)
+                sys.stdout.write(key)
+                break
+            elif key.isprintable():
+                buffer.append(key)
+                sys.stdout.write(key)
+            sys.stdout.flush()
+        
+        line = ''.join(buffer)
+        if line.strip() and line.lower() != 'q' and (not self._history or self._history[-1] != line):
+            self._history.append(line)
+        
+        sys.stdout.write('\n')
+        sys.stdout.flush()
+        return line
+    
+    @staticmethod
+    def _replace_line(buffer: List[str], text: str):
+        """Erase the echoed buffer and replace it with text."""
+        sys.stdout.write('\b \b' * len(buffer) + text)
+        buffer[:] = text
 
 
 class DisplayManager:
@@ -19,108 +253,235 @@ class DisplayManager:
     
     # Constants
     DEFAULT_TERMINAL_WIDTH = 80
+    DEFAULT_TERMINAL_HEIGHT = 24
     MAX_CONSOLE_WIDTH = 120
     REPOS_PER_PAGE = 5
     LINES_PER_PAGE = 30
-    
-    # Language emoji mapping
-    LANGUAGE_EMOJIS = {
-        'Python': '🐍', 'JavaScript': '🟨', 'TypeScript': '🔷', 'Java': '☕',
-        'C++': '⚡', 'C': '🔧', 'C#': '💜', 'Go': '🐹', 'Rust': '🦀',
-        'PHP': '🐘', 'Ruby': '💎', 'Swift': '🍎', 'Kotlin': '🟣',
-        'Dart': '🎯', 'Shell': '🐚', 'HTML': '🌐', 'CSS': '🎨',
-        'Vue': '💚', 'React': '⚛️', 'Angular': '🅰️', 'Jupyter Notebook': '📓',
-        'Lua': '🌙', 'R': '📊', 'Scala': '🔺', 'Perl': '🐪',
-        'Haskell': '🎓', 'Clojure': '🔮', 'Elixir': '💧', 'Erlang': '📡',
-        'Unknown': '❓'
-    }
+    CLEAR_SCREEN = "\033[2J\033[H"  # Erase display, cursor home
     
     # Range display mapping
     RANGE_EMOJIS = {"daily": "📅", "weekly": "📊", "monthly": "📈"}
     
-    # Trending indicators based on stars today
-    TRENDING_THRESHOLDS = [
-        (100, "🔥", "red"),
-        (50, "🚀", "yellow"), 
-        (10, "📈", "green"),
-        (0, "", "dim")
-    ]
+    # Cached (columns, lines) terminal size, cleared on SIGWINCH
+    _cached_winsize: Optional[tuple[int, int]] = None
     
     def __init__(self):
-        self.terminal_width = self._get_terminal_width()
-        self.console = Console(width=min(self.terminal_width - 4, self.MAX_CONSOLE_WIDTH))
+        self._width = self._get_terminal_width()
+        self._width_dirty = False
+        self.console = Console(width=self._console_width())
+        # Unstyled output (piped, dumb terminal) skips Rich's renderer for repo entries entirely
+        self._styled_output = self.console.color_system is not None
+        self._key_reader = _KeyReader()
+        # Rendered (ANSI) repo entries keyed by (index, id(repo)); cleared on resize
+        self._repo_render_cache: Dict[tuple[int, int], str] = {}
+        # Precomputed display fields keyed by id(repo), filled by prepare()
+        self._repo_fields: Dict[int, _RepoFields] = {}
+        # Header strings per date range; they do not depend on the width
+        self._header_cache: Dict[str, str] = {}
+        self._readme_viewer = None
+        self._wrap_width = self._description_width()
+        
+        # Hot-path output is written to stdout by a background thread
+        self._out_queue: "queue.Queue[str]" = queue.Queue()
+        # Set when a write fails; re-raised on the main thread by _emit()/_drain()
+        self._writer_error: Optional[Exception] = None
+        threading.Thread(target=self._writer_loop, daemon=True).start()
+        
+        # Load the README renderer while the user browses the list
+        threading.Thread(target=self._prewarm_readme_renderer, daemon=True).start()
+        
+        if hasattr(signal, 'SIGWINCH'):  # Not available on Windows
+            try:
+                signal.signal(signal.SIGWINCH, self._handle_resize)
+            except ValueError:
+                # Handlers can only be installed from the main thread; fall back to the initial size
+                pass
     
-    def _get_terminal_width(self) -> int:
-        """Get the current terminal width."""
+    @staticmethod
+    def _prewarm_readme_renderer():
+        """Import and exercise the markdown/pygments stack so the first README opens quickly."""
         try:
-            return shutil.get_terminal_size().columns
-        except:
-            return self.DEFAULT_TERMINAL_WIDTH
+            import io
+            from rich.markdown import Markdown
+            from . import display_readme
+            
+            Console(file=io.StringIO(), width=80).print(Markdown("# warm\n\n```python\npass\n```"))
+        except Exception:
+            # Purely an optimization; the real render reports its own errors
+            pass
     
-    def _format_number(self, number_str: str) -> str:
-        """Format number string with commas for better readability."""
-        try:
-            num = int(number_str.replace(',', ''))
-            return f"{num:,}"
-        except (ValueError, AttributeError):
-            return number_str or "0"
+    def _writer_loop(self):
+        """Write queued output buffers to stdout, coalescing whatever is pending into one write and flush."""
+        while True:
+            bufs = [self._out_queue.get()]
+            while True:
+                try:
+                    bufs.append(self._out_queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                # After a failure, output is dropped until the main thread has seen the error
+                if self._writer_error is None:
+                    sys.stdout.write("".join(bufs))
+                    sys.stdout.flush()
+            except Exception as e:
+                self._writer_error = e
+            finally:
+                for _ in bufs:
+                    self._out_queue.task_done()
     
-    def _get_trending_indicator(self, stars_period: str) -> tuple[str, str]:
-        """Get trending indicator and style based on stars in current period."""
-        try:
-            stars_num = int(stars_period.replace(',', '') or '0')
-            for threshold, indicator, style in self.TRENDING_THRESHOLDS:
-                if stars_num >= threshold:
-                    return indicator, style
-        except (ValueError, AttributeError):
-            pass
-        return "", "dim"
+    def _raise_writer_error(self):
+        """Re-raise a write failure from the background writer, once."""
+        error, self._writer_error = self._writer_error, None
+        if error is not None:
+            raise error
     
-    def _clean_repo_name(self, name: str) -> str:
-        """Clean up repository name by removing extra whitespace."""
-        return re.sub(r'\s+', ' ', name.strip())
+    def _emit(self, buf: str):
+        """Queue a buffer for the background writer."""
+        self._raise_writer_error()
+        self._out_queue.put(buf)
+    
+    def _drain(self):
+        """Wait until all queued output has been written."""
+        self._out_queue.join()
+        self._raise_writer_error()
+    
+    @classmethod
+    def _winsize(cls) -> tuple[int, int]:
+        """Get the terminal size, querying the terminal only when not cached."""
+        if cls._cached_winsize is None:
+            try:
+                size = os.get_terminal_size(1)  # stdout
+                columns, lines = size.columns, size.lines
+            except OSError:
+                columns = lines = 0
+            # Like shutil.get_terminal_size, use the defaults when the terminal reports a zero size
+            cls._cached_winsize = (columns or cls.DEFAULT_TERMINAL_WIDTH, lines or cls.DEFAULT_TERMINAL_HEIGHT)
+        return cls._cached_winsize
+    
+    @classmethod
+    def _invalidate_winsize(cls):
+        """Drop the cached terminal size so the next lookup re-queries it."""
+        cls._cached_winsize = None
+    
+    def _handle_resize(self, signum, frame):
+        """Mark terminal-size-derived state stale; it is rebuilt on next use."""
+        self._invalidate_winsize()
+        self._width_dirty = True
+    
+    @property
+    def terminal_width(self) -> int:
+        """Current terminal width, refreshed after a resize."""
+        self._apply_pending_resize()
+        return self._width
+    
+    def _apply_pending_resize(self):
+        """Rebuild width-derived state if the terminal was resized since last use."""
+        if not self._width_dirty:
+            return
+        self._width_dirty = False
+        self._width = self._get_terminal_width()
+        self.console.width = self._console_width()
+        self._wrap_width = self._description_width()
+        self._repo_render_cache.clear()
+    
+    def _console_width(self) -> int:
+        """Get the console width for the current terminal width."""
+        return min(self._width - 4, self.MAX_CONSOLE_WIDTH)
+    
+    def _description_width(self) -> int:
+        """Get the available description width (console width minus indentation)."""
+        # From the cached width; console.size would query the terminal for its height
+        return self._console_width() - 4  # 4 spaces for indentation
+    
+    def _get_terminal_width(self) -> int:
+        """Get the current terminal width."""
+        return self._winsize()[0]
+    
+    # Memoized module-level helpers, bound directly to skip a wrapper call
+    _format_number = staticmethod(_format_number)
+    
+    _clean_repo_name = staticmethod(_clean_repo_name)
     
     def _get_language_emoji(self, language: str) -> str:
         """Get emoji for programming language."""
-        return self.LANGUAGE_EMOJIS.get(language, self.LANGUAGE_EMOJIS['Unknown'])
+        return _LANGUAGE_EMOJIS[language]
+    
+    def prepare(self, repos: List[Dict[str, str]]):
+        """Precompute display fields for each repository once, before rendering."""
+        for repo in repos:
+            self._repo_fields[id(repo)] = self._compute_repo_fields(repo)
+    
+    def _compute_repo_fields(self, repo: Dict[str, str]) -> _RepoFields:
+        """Derive the display fields for a single repository."""
+        # The scraper already strips and interns language names
+        language = repo.get('language', 'Unknown')
+        
+        # Parse the period count once for both its formatting and its trending tier
+        stars_period = repo.get('stars_period', '0')
+        stars_period_num = _parse_number(stars_period)
+        trend_indicator, trend_style = _trending_tier(stars_period_num)
+        
+        return _RepoFields(
+            name=self._clean_repo_name(repo.get('name', 'Unknown')),
+            lang_emoji=self._get_language_emoji(language),
+            stars=self._format_number(repo.get('stars', '0')),
+            stars_period=_format_parsed_number(stars_period_num, stars_period),
+            trend_indicator=trend_indicator,
+            trend_style=trend_style
+        )
     
     def _create_repo_line(self, index: int, repo: Dict[str, str]) -> Text:
         """Create a formatted text line for a repository."""
-        name = self._clean_repo_name(repo.get('name', 'Unknown'))
-        language = repo.get('language', 'Unknown').strip()
-        stars = self._format_number(repo.get('stars', '0'))
-        stars_period = self._format_number(repo.get('stars_period', '0'))
+        fields = self._repo_fields.get(id(repo))
+        if fields is None:
+            fields = self._compute_repo_fields(repo)
+        name = fields.name
+        stars_style = fields.trend_style
         
-        lang_emoji = self._get_language_emoji(language)
-        trending_indicator, stars_style = self._get_trending_indicator(repo.get('stars_period', '0'))
+        # Build the plain line once and style it with precomputed spans
+        prefix = f"{index:2}. "
+        details = f"  {fields.lang_emoji}  ⭐{fields.stars}"
+        trend = f"  {fields.trend_indicator}+{fields.stars_period}"
         
-        line = Text()
-        line.append(f"{index:2}. ", style="dim")
-        line.append(f"{name}", style="bold")
-        line.append(f"  {lang_emoji}", style="dim")
-        line.append(f"  ⭐{stars}", style="dim")
-        line.append(f"  {trending_indicator}", style=stars_style)
-        line.append(f"+{stars_period}", style=stars_style)
+        name_end = len(prefix) + len(name)
+        details_end = name_end + len(details)
+        trend_end = details_end + len(trend)
         
-        return line
+        return Text("".join([prefix, name, details, trend, "\n"]), spans=[
+            Span(0, len(prefix), "dim"),
+            Span(len(prefix), name_end, "bold"),
+            Span(name_end, details_end, "dim"),
+            Span(details_end, trend_end, stars_style),
+        ])
+    
+    def _render_header(self, date_range: str) -> str:
+        """Render the application header to a string, cached per date range."""
+        rendered = self._header_cache.get(date_range)
+        if rendered is None:
+            range_emoji = self.RANGE_EMOJIS.get(date_range, "📋")
+            range_text = date_range.title() if date_range != "current" else "Current List"
+            
+            rendered = "".join([
+                "\n",
+                self._style("🚀 GitHub Trending Repositories", _SGR_BOLD),
+                self._style(f" - {range_text} {range_emoji}", _SGR_DIM),
+                "\n\n",
+            ])
+            self._header_cache[date_range] = rendered
+        return rendered
+    
+    def _style(self, text: str, sgr: str) -> str:
+        """Wrap text in an SGR escape sequence when output is styled."""
+        return f"{sgr}{text}{_SGR_RESET}" if self._styled_output else text
     
     def _print_header(self, date_range: str):
         """Print the application header."""
-        range_emoji = self.RANGE_EMOJIS.get(date_range, "📋")
-        range_text = date_range.title() if date_range != "current" else "Current List"
-        
-        header_text = Text()
-        header_text.append("🚀 GitHub Trending Repositories", style="bold")
-        header_text.append(f" - {range_text} {range_emoji}", style="dim")
-        
-        self.console.print()
-        self.console.print(header_text)
-        self.console.print()
+        self._emit(self._render_header(date_range))
     
     def _clear_screen_and_show_header(self, date_range: str = "daily"):
         """Clear screen and redisplay header."""
-        print("\033[H\033[2J", end="")
-        self._print_header(date_range)
+        self._emit(self.CLEAR_SCREEN + self._render_header(date_range))
     
     def show_repositories(self, repos: List[Dict[str, str]], date_range: str, callback: Optional[Callable] = None):
         """Display a list of trending repositories with Rich formatting."""
@@ -128,232 +489,146 @@ class DisplayManager:
             self.console.print("[red]No repositories found.[/red]")
             return
         
+        self.prepare(repos)
         self._print_header(date_range)
-        self._paginate_repositories(repos, date_range, callback)
+        with self._key_reader:
+            self._paginate_repositories(repos, date_range, callback)
         self._print_footer(len(repos))
+        self._drain()
     
     def _print_footer(self, repo_count: int):
         """Print the application footer."""
-        footer_text = Text()
-        footer_text.append("Found ", style="dim")
-        footer_text.append(str(repo_count), style="bold")
-        footer_text.append(" trending repositories", style="dim")
-        
-        self.console.print()
-        self.console.print(footer_text)
-    
-    def _display_repo_list(self, repos: List[Dict[str, str]]):
-        """Display a list of repositories."""
-        for i, repo in enumerate(repos):
-            line = self._create_repo_line(i + 1, repo)
-            description = repo.get('description', 'No description').strip()
-            
-            self.console.print(line)
-            self._print_description_with_indent(description)
-            self.console.print()
+        self._emit("".join([
+            "\n",
+            self._style("Found ", _SGR_DIM),
+            self._style(str(repo_count), _SGR_BOLD),
+            self._style(" trending repositories", _SGR_DIM),
+            "\n",
+        ]))
     
-    def _print_description_with_indent(self, description: str):
-        """Print description with proper indentation for wrapped lines."""
-        import textwrap
-        
-        # Calculate available width (console width minus indentation)
-        available_width = self.console.size.width - 4  # 4 spaces for indentation
-        
+    def _display_repo_list(self, repos: List[Dict[str, str]], start: int = 1):
+        """Display a list of repositories, numbered from start."""
+        self._apply_pending_resize()
+        self._emit("".join(self._render_repo(i, repo) for i, repo in enumerate(repos, start)))
+    
+    def _render_repo(self, index: int, repo: Dict[str, str]) -> str:
+        """Get the full rendered entry for a repository, running Rich at most once per entry."""
+        key = (index, id(repo))
+        rendered = self._repo_render_cache.get(key)
+        if rendered is None:
+            # Descriptions arrive whitespace-collapsed from the scraper, and wrapping drops edges anyway
+            description = repo.get('description', 'No description')
+            entry = Text().join([
+                self._create_repo_line(index, repo),
+                self._print_description_with_indent(description),
+                Text("\n"),
+            ])
+            if self._styled_output:
+                with self.console.capture() as capture:
+                    self.console.print(entry, end="")
+                rendered = capture.get()
+            else:
+                rendered = entry.plain
+            self._repo_render_cache[key] = rendered
+        return rendered
+    
+    def _print_description_with_indent(self, description: str) -> Text:
+        """Build description text with proper indentation for wrapped lines."""
         # Wrap the text to fit within available width
-        wrapped_lines = textwrap.wrap(description, width=available_width)
+        wrapped_lines = _wrap_words(description, self._wrap_width)
         
-        # Print each line with proper indentation
-        for line in wrapped_lines:
-            self.console.print(f"    [dim]{line}[/dim]")
+        # Indent each line and keep the whole block dim
+        return Text("".join([f"    {line}\n" for line in wrapped_lines]), style="dim")
     
     
     def show_repository_header(self, repo: Dict[str, str]):
         """Show detailed header information for a repository."""
-        name = repo.get('name', 'Unknown')
-        url = repo.get('url', '')
-        language = repo.get('language', 'Unknown')
-        stars = repo.get('stars', '0')
-        stars_period = repo.get('stars_period', '0')
-        description = repo.get('description', 'No description')
-        
-        print(f"📦 Name: {name}")
-        print(f"🔗 URL: {url}")
-        print(f"🏷️  Language: {language}")
-        print(f"⭐ Stars: {stars} (+{stars_period} this period)")
-        print(f"📝 Description: {description}")
+        sys.stdout.write(_REPO_HEADER_TEMPLATE.format_map({
+            'name': repo.get('name', 'Unknown'),
+            'url': repo.get('url', ''),
+            'language': repo.get('language', 'Unknown'),
+            'stars': repo.get('stars', '0'),
+            'stars_period': repo.get('stars_period', '0'),
+            'description': repo.get('description', 'No description'),
+        }))
     
     def show_readme(self, readme_content: str):
         """Display README content with beautiful Rich markdown rendering."""
-        print("\n" + "-"*80)
-        print("📖 README")
-        print("-"*80)
-        
-        if not readme_content or readme_content.strip() == "":
-            print("No README content available.")
-            return
-        
-        self._render_readme_content(readme_content)
-    
-    def _render_readme_content(self, content: str):
-        """Render markdown content using Rich with pagination."""
-        try:
-            markdown = Markdown(content)
-            with self.console.capture() as capture:
-                self.console.print(markdown)
-            
-            rendered_content = capture.get()
-            self._paginate_content(rendered_content.split('\n'))
-            
-        except Exception as e:
-            print(f"⚠️  Error rendering with Rich: {e}")
-            self._paginate_content(content.split('\n'))
+        # The README viewer is only imported once a README is actually opened
+        if self._readme_viewer is None:
+            from .display_readme import ReadmeViewer
+            self._readme_viewer = ReadmeViewer(self)
+        self._readme_viewer.show_readme(readme_content)
     
     def _get_key(self):
         """Get a single keypress from the user."""
-        try:
-            # Check if we're in a terminal that supports raw mode
-            if not sys.stdin.isatty():
-                # Fallback for non-interactive environments
-                return 'quit'
-                
-            fd = sys.stdin.fileno()
-            old_settings = termios.tcgetattr(fd)
-            tty.setraw(sys.stdin.fileno())
-            key = sys.stdin.read(1)
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-            
-            # Handle arrow keys (they come as escape sequences)
-            if key == '\x1b':  # ESC sequence
-                key += sys.stdin.read(2)
-                if key == '\x1b[A':  # Up arrow
-                    return 'up'
-                elif key == '\x1b[B':  # Down arrow
-                    return 'down'
-                elif key == '\x1b[5~':  # Page Up
-                    return 'page_up'
-                elif key == '\x1b[6~':  # Page Down
-                    return 'page_down'
-            elif key == '\r' or key == '\n':  # Enter
-                return 'enter'
-            elif key == 'q' or key == 'Q':
-                return 'quit'
-            elif key == '\x03':  # Ctrl+C
-                return 'quit'
-            
-            return key
-        except:
-            # Fallback for environments that don't support raw terminal input
-            return 'quit'
+        return self._key_reader.read_key()
     
     def _get_terminal_height(self) -> int:
         """Get the current terminal height."""
-        try:
-            return shutil.get_terminal_size().lines
-        except:
-            return 24  # Default fallback
-    
-    def _paginate_content(self, lines: List[str]):
-        """Display content with arrow key navigation."""
-        if not lines:
-            return
-            
-        current_line = 0
-        terminal_height = self._get_terminal_height()
-        max_lines = max(15, terminal_height - 2)  # Leave space for instructions (2 lines)
-        
-        while True:
-            # Clear screen
-            print("\033[2J\033[H", end="")
-            
-            # Display current page
-            end_line = min(current_line + max_lines, len(lines))
-            for i in range(current_line, end_line):
-                print(lines[i])
-            
-            # Show navigation info
-            total_lines = len(lines)
-            print(f"\n📖 README ({current_line + 1}-{end_line} of {total_lines}) | ↑/↓ scroll, Enter/PgDn more, 'q' exit")
-            
-            # Get user input
-            key = self._get_key()
-            
-            if key == 'quit':
-                break
-            elif key == 'up':
-                current_line = max(0, current_line - 1)
-            elif key == 'down':
-                current_line = min(len(lines) - max_lines, current_line + 1)
-            elif key == 'page_up':
-                current_line = max(0, current_line - max_lines)
-            elif key == 'enter' or key == 'page_down':
-                current_line = min(len(lines) - max_lines, current_line + max_lines)
-        
-        print("\n📖 README reading finished.")
+        return self._winsize()[1]
     
     def _paginate_repositories(self, repos: List[Dict[str, str]], date_range: str, callback: Optional[Callable] = None):
         """Display repositories with scrolling pagination and interactive selection."""
         current_repo = 0
-        displayed_repos = []
         
         while True:
-            # Clear screen and show header if not first iteration
-            if current_repo > 0:
-                self._clear_screen_and_show_header(date_range)
-            
-            # Add new repositories to display
+            # Print only the next page below what is already on screen
             end_repo = min(current_repo + self.REPOS_PER_PAGE, len(repos))
-            for i in range(current_repo, end_repo):
-                if i >= len(displayed_repos):
-                    displayed_repos.append(repos[i])
-            
-            # Display all repositories shown so far
-            self._display_repo_list(displayed_repos)
-            
-            # Update current position
-            if current_repo < len(repos):
-                current_repo = end_repo
+            self._display_repo_list(repos[current_repo:end_repo], start=current_repo + 1)
+            current_repo = end_repo
             
             # Handle user input
-            if not self._handle_pagination_input(repos, displayed_repos, current_repo, date_range, callback):
+            if not self._handle_pagination_input(repos, current_repo, date_range, callback):
                 break
     
-    def _handle_pagination_input(self, repos: List[Dict[str, str]], displayed_repos: List[Dict[str, str]], 
-                                current_repo: int, date_range: str, callback: Optional[Callable]) -> bool:
-        """Handle user input for pagination. Returns False to exit, True to continue."""
+    def _redraw_repos(self, repos: List[Dict[str, str]], upto: int, date_range: str):
+        """Clear the screen and redraw the header and the first upto repositories."""
+        self._clear_screen_and_show_header(date_range)
+        self._display_repo_list(repos[:upto])
+    
+    def _handle_pagination_input(self, repos: List[Dict[str, str]], current_repo: int,
+                                date_range: str, callback: Optional[Callable]) -> bool:
+        """Handle user input for pagination. Returns False to exit, True to continue.
+        
+        The first current_repo entries of repos are the ones on screen.
+        """
+        # Make sure the page is on screen before prompting
+        self._drain()
+        
         # Show prompt
         if current_repo < len(repos):
             remaining = len(repos) - current_repo
             self.console.print(f"[dim]({remaining} more repositories)[/dim]")
-            prompt = f"Enter repo number (1-{len(displayed_repos)}), Enter for more, 'q' to quit: "
+            prompt = f"Enter repo number (1-{current_repo}), Enter for more, 'q' to quit: "
         else:
-            prompt = f"Enter repo number (1-{len(displayed_repos)}) or 'q' to quit: "
+            prompt = f"Enter repo number (1-{current_repo}) or 'q' to quit: "
         
         try:
-            user_input = input(prompt).strip().lower()
+            user_input = self._key_reader.read_line(prompt).strip().lower()
             
             if user_input == 'q':
                 return False
             elif user_input == '':
                 if current_repo >= len(repos):
                     # No more repos, redisplay current state
-                    self._clear_screen_and_show_header(date_range)
-                    self._display_repo_list(displayed_repos)
+                    self._redraw_repos(repos, current_repo, date_range)
                 return True
             else:
                 # Try to parse as repository number
                 try:
                     repo_num = int(user_input)
-                    if 1 <= repo_num <= len(displayed_repos):
+                    if 1 <= repo_num <= current_repo:
                         if callback:
-                            callback(repo_num - 1, displayed_repos)
-                            self._clear_screen_and_show_header(date_range)
+                            callback(repo_num - 1, repos)
+                            self._redraw_repos(repos, current_repo, date_range)
                         else:
-                            selected_repo = displayed_repos[repo_num - 1]
+                            selected_repo = repos[repo_num - 1]
                             self.console.print(f"\n[green]Selected: {selected_repo.get('name', 'Unknown')}[/green]")
-                            input("Press Enter to continue browsing...")
+                            self._key_reader.read_line("Press Enter to continue browsing...")
                         return True
                     else:
-                        self.console.print(f"[red]Please enter a number between 1 and {len(displayed_repos)}[/red]")
+                        self.console.print(f"[red]Please enter a number between 1 and {current_repo}[/red]")
                         return True
                 except ValueError:
                     self.console.print("[red]Please enter a valid number, Enter, or 'q'[/red]")
@@ -364,8 +639,8 @@ class DisplayManager:
     
     def show_error(self, message: str):
         """Display an error message."""
-        print(f"❌ Error: {message}")
+        sys.stdout.write(f"❌ Error: {message}\n")
     
     def show_success(self, message: str):
         """Display a success message."""
-        print(f"✅ {message}")
+        sys.stdout.write(f"✅ {message}\n")
@@ -0,0 +1,169 @@
+"""
+README Viewer for GitHub Trending CLI Tool
+Handles README rendering and pagination, loaded only when a README is opened.
+"""
+
+import hashlib
+import os
+import pydoc
+import sys
+from collections import OrderedDict
+from itertools import islice
+from typing import List, Callable, Iterator, Optional, TYPE_CHECKING
+from rich.markdown import Markdown
+from rich.segment import Segment, Segments
+
+if TYPE_CHECKING:
+    from .display import DisplayManager
+
+
+class ReadmeViewer:
+    """Renders README markdown and pages through it."""
+    
+    # Constants
+    README_CACHE_SIZE = 8
+    README_PAGER_LINES = 50  # Longer READMEs are handed to the OS pager
+    README_BANNER = "\n".join(["", "-" * 80, "📖 README", "-" * 80])
+    
+    def __init__(self, display: "DisplayManager"):
+        self.display = display
+        self.console = display.console
+        # Rendered README lines keyed by (content digest, console width), LRU-bounded
+        self._readme_cache: OrderedDict[tuple[bytes, int], List[List[Segment]]] = OrderedDict()
+    
+    def show_readme(self, readme_content: str):
+        """Display README content with beautiful Rich markdown rendering."""
+        print(self.README_BANNER)
+        
+        if not readme_content or readme_content.isspace():
+            print("No README content available.")
+            return
+        
+        self._render_readme_content(readme_content)
+    
+    def _render_readme_content(self, content: str):
+        """Render markdown content using Rich with pagination."""
+        self.display._apply_pending_resize()
+        try:
+            key = self._cache_key(content)
+            lines = self._cached_lines(key)
+            
+            if not sys.stdout.isatty():
+                # Nothing to navigate, stream it straight out a chunk at a time
+                self._write_segment_lines(lines if lines is not None else self._stream_markdown_lines(content))
+                return
+            
+            if lines is None:
+                lines = self._render_markdown_lines(key, content)
+            
+            if len(lines) > self.README_PAGER_LINES:
+                self._page_with_system_pager(self._render_segment_lines(lines))
+            else:
+                self._paginate_content(lines, self._render_segment_lines)
+            
+        except Exception as e:
+            print(f"⚠️  Error rendering with Rich: {e}")
+            self._show_plain_content(content)
+    
+    def _show_plain_content(self, content: str):
+        """Show unrendered README text, only splitting it when paginating ourselves."""
+        if not sys.stdout.isatty():
+            sys.stdout.write(content + "\n")
+        elif content.count('\n') + 1 > self.README_PAGER_LINES:
+            self._page_with_system_pager(content)
+        else:
+            self._paginate_content(content.split('\n'))
+    
+    def _page_with_system_pager(self, text: str):
+        """Show rendered text in the OS pager ($PAGER, falling back to less)."""
+        # Same default git uses for its pager; -R keeps Rich's colors intact
+        os.environ.setdefault('LESS', 'FRX')
+        pydoc.pager(text)
+        print("\n📖 README reading finished.")
+    
+    def _cache_key(self, content: str) -> tuple[bytes, int]:
+        """Key a render by content digest and the width it was laid out for."""
+        return (hashlib.blake2b(content.encode(), digest_size=8).digest(), self.display._console_width())
+    
+    def _cached_lines(self, key: tuple[bytes, int]) -> Optional[List[List[Segment]]]:
+        """Return a cached render, marking it most recently used."""
+        lines = self._readme_cache.get(key)
+        if lines is not None:
+            self._readme_cache.move_to_end(key)
+        return lines
+    
+    def _stream_markdown_lines(self, content: str) -> Iterator[List[Segment]]:
+        """Lazily render markdown to segment lines, one block at a time."""
+        options = self.console.options
+        return Segment.split_and_crop_lines(
+            self.console.render(Markdown(content), options), options.max_width,
+            pad=False, include_new_lines=False
+        )
+    
+    def _render_markdown_lines(self, key: tuple[bytes, int], content: str) -> List[List[Segment]]:
+        """Render markdown to segment lines and cache the result."""
+        lines = list(self._stream_markdown_lines(content))
+        self._readme_cache[key] = lines
+        if len(self._readme_cache) > self.README_CACHE_SIZE:
+            self._readme_cache.popitem(last=False)
+        return lines
+    
+    def _write_segment_lines(self, lines: Iterator[List[Segment]]):
+        """Write segment lines to stdout in page-sized chunks as they are rendered."""
+        lines = iter(lines)
+        while True:
+            chunk = list(islice(lines, self.README_PAGER_LINES))
+            if not chunk:
+                break
+            sys.stdout.write(self._render_segment_lines(chunk) + "\n")
+    
+    def _render_segment_lines(self, lines: List[List[Segment]]) -> str:
+        """Render a window of segment lines to a string for display."""
+        segments = []
+        for i, line in enumerate(lines):
+            if i:
+                segments.append(Segment.line())
+            segments.extend(line)
+        
+        with self.console.capture() as capture:
+            self.console.print(Segments(segments), end="")
+        return capture.get()
+    
+    def _paginate_content(self, lines: list, render_page: Callable[[list], str] = "\n".join):
+        """Display content with arrow key navigation, rendering only the visible page."""
+        if not lines:
+            return
+            
+        current_line = 0
+        total_lines = len(lines)
+        
+        with self.display._key_reader:
+            terminal_height = self.display._get_terminal_height()
+            max_lines = max(15, terminal_height - 2)  # Leave space for instructions (2 lines)
+            max_start = max(0, total_lines - max_lines)
+            
+            while True:
+                # Clear screen, current page and navigation info in one write
+                end_line = min(current_line + max_lines, total_lines)
+                self.display._emit("".join([
+                    self.display.CLEAR_SCREEN,
+                    render_page(lines[current_line:end_line]),
+                    f"\n\n📖 README ({current_line + 1}-{end_line} of {total_lines}) | ↑/↓ scroll, Enter/PgDn more, 'q' exit\n",
+                ]))
+                
+                # Get user input
+                key = self.display._get_key()
+                
+                if key == 'quit':
+                    break
+                elif key == 'up':
+                    current_line = max(0, current_line - 1)
+                elif key == 'down':
+                    current_line = max_start if current_line + 1 > max_start else current_line + 1
+                elif key == 'page_up':
+                    current_line = max(0, current_line - max_lines)
+                elif key == 'enter' or key == 'page_down':
+                    current_line = max_start if current_line + max_lines > max_start else current_line + max_lines
+        
+        self.display._drain()
+        print("\n📖 README reading finished.")
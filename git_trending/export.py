@@ -3,18 +3,25 @@ Export Manager for GitHub Trending CLI Tool
 Handles exporting trending repositories to CSV and JSON Lines formats.
 """
 
+import csv
 import json
 from datetime import datetime
-from typing import List, Dict
+from typing import Callable, Iterable, List, Dict, TextIO
 from pathlib import Path
-import pandas as pd
+
+try:
+    import orjson  # Optional; much faster JSON encoding when installed
+except ImportError:
+    orjson = None
 
 
 class ExportManager:
-    """Manages exporting repository data to various formats using pandas."""
+    """Manages exporting repository data to various formats, streaming rows to disk."""
     
     # Constants
     EXPORT_DIR = "exported"
+    METADATA_FIELDS = ['range', 'export_datetime']
+    WRITE_BUFFER_SIZE = 1 << 16  # Bytes buffered before each write to disk
     
     def __init__(self):
         self._ensure_export_directory()
@@ -29,20 +36,66 @@ class ExportManager:
         extension = "jsonl" if export_format == "json" else export_format
         return f"{self.EXPORT_DIR}/github_trending_{date_range}_{timestamp}.{extension}"
     
-    def _create_dataframe(self, repos: List[Dict[str, str]], date_range: str) -> pd.DataFrame:
-        """Create pandas DataFrame from repository data with additional columns."""
-        # Create DataFrame from the list of dictionaries
-        df = pd.DataFrame(repos)
+    def _metadata(self, date_range: str) -> Dict[str, str]:
+        """Build the metadata columns added to every exported row."""
+        return {
+            'range': date_range.title(),
+            'export_datetime': datetime.now().isoformat()
+        }
+    
+    def _fieldnames(self, repos: List[Dict[str, str]]) -> List[str]:
+        """Collect column names in first-seen order, followed by the metadata columns."""
+        fieldnames = {}
+        for repo in repos:
+            fieldnames.update(dict.fromkeys(repo))
+        return [name for name in fieldnames if name not in self.METADATA_FIELDS] + self.METADATA_FIELDS
+    
+    @staticmethod
+    def _json_encoder() -> Callable[[Dict[str, str]], str]:
+        """Get a compact, non-ASCII-escaping JSON encoder for one row."""
+        if orjson is not None:
+            # orjson emits compact UTF-8 without escaping, same as the json settings below
+            return lambda row: orjson.dumps(row).decode()
+        return json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+    
+    def export_repositories_streaming(self, repos: Iterable[Dict[str, str]], fh: TextIO,
+                                      date_range: str, export_format: str):
+        """
+        Write repositories to an open file handle one row at a time.
         
-        # Add metadata columns
-        df['range'] = date_range.title()
-        df['export_datetime'] = datetime.now().isoformat()
+        Args:
+            repos: Repository dictionaries (a list is needed for CSV column names)
+            fh: Text file handle opened for writing
+            date_range: Time range (daily, weekly, monthly)
+            export_format: Format to export (csv or json)
+            
+        Raises:
+            ValueError: If export_format is not supported
+        """
+        metadata = self._metadata(date_range)
         
-        return df
+        if export_format == 'csv':
+            repos = list(repos)
+            fieldnames = self._fieldnames(repos)
+            repo_fields = fieldnames[:-len(self.METADATA_FIELDS)]
+            # The metadata columns are the same on every row, so build their cells once
+            metadata_cells = [metadata[name] for name in self.METADATA_FIELDS]
+            
+            writer = csv.writer(fh, lineterminator='\n')
+            writer.writerow(fieldnames)
+            writer.writerows([repo.get(name, '') for name in repo_fields] + metadata_cells for repo in repos)
+        elif export_format == 'json':
+            # One compact JSON object per line, written in a single call
+            encode = self._json_encoder()
+            write = fh.write
+            for repo in repos:
+                write(encode({**repo, **metadata}) + '\n')
+        else:
+            raise ValueError(f"Unsupported export format: {export_format}")
     
     def export_to_csv(self, repos: List[Dict[str, str]], date_range: str) -> str:
         """
-        Export repositories to CSV format using pandas.
+        Export repositories to CSV format.
         
         Args:
             repos: List of repository dictionaries
@@ -52,16 +105,15 @@ class ExportManager:
             Path to the exported file
         """
         filename = self._generate_filename(date_range, 'csv')
-        df = self._create_dataframe(repos, date_range)
         
-        # Export to CSV with pandas
-        df.to_csv(filename, index=False, encoding='utf-8')
+        with open(filename, 'w', encoding='utf-8', newline='', buffering=self.WRITE_BUFFER_SIZE) as f:
+            self.export_repositories_streaming(repos, f, date_range, 'csv')
         
         return filename
     
     def export_to_jsonl(self, repos: List[Dict[str, str]], date_range: str) -> str:
         """
-        Export repositories to JSON Lines format using pandas.
+        Export repositories to JSON Lines format.
         
         Args:
             repos: List of repository dictionaries
@@ -71,20 +123,15 @@ class ExportManager:
             Path to the exported file
         """
         filename = self._generate_filename(date_range, 'json')
-        df = self._create_dataframe(repos, date_range)
         
-        # Export to JSON Lines format (one JSON object per line)
-        # Use force_ascii=False to avoid escaping and ensure proper UTF-8 encoding
-        with open(filename, 'w', encoding='utf-8') as f:
-            for record in df.to_dict('records'):
-                json.dump(record, f, ensure_ascii=False, separators=(',', ':'))
-                f.write('\n')
+        with open(filename, 'w', encoding='utf-8', buffering=self.WRITE_BUFFER_SIZE) as f:
+            self.export_repositories_streaming(repos, f, date_range, 'json')
         
         return filename
     
     def export_repositories(self, repos: List[Dict[str, str]], date_range: str, export_format: str) -> str:
         """
-        Export repositories in the specified format using pandas.
+        Export repositories in the specified format.
         
         Args:
             repos: List of repository dictionaries
@@ -3,12 +3,42 @@ GitHub Trending Scraper
 Handles scraping trending repositories from GitHub.
 """
 
+import json
+import os
+import sys
 import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from lxml import etree
+from typing import Iterable, List, Dict, Optional, Union
 import re
 
 
+# Precompiled patterns used for every scraped repository
+_SLASH_SPACING_RE = re.compile(r'\s*/\s*')
+# "N stars today" / "N stars this week" / "N stars this month"
+_STARS_PERIOD_RE = re.compile(r'(\d+(?:,\d+)*)\s+stars (?:today|this week|this month)')
+
+
+def _has_class(class_name: str) -> str:
+    """XPath predicate matching elements whose class attribute contains class_name."""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {class_name} ")'
+
+
+# Precompiled XPath lookups within a repository article
+_TITLE_LINK_XPATH = etree.XPath(f'(.//h2[{_has_class("h3")}])[1]//a')
+_DESCRIPTION_XPATH = etree.XPath(f'.//p[{_has_class("col-9")}]')
+_LANGUAGE_XPATH = etree.XPath('.//span[@itemprop="programmingLanguage"]')
+_STARGAZERS_XPATH = etree.XPath(
+    './/a[re:test(@href, "/stargazers$")]',
+    namespaces={'re': 'http://exslt.org/regular-expressions'}
+)
+_SPANS_XPATH = etree.XPath('.//span')
+
+
+def _element_text(element) -> str:
+    """All text inside an element, like BeautifulSoup's get_text()."""
+    return ''.join(element.itertext())
+
+
 class GitHubTrendingScraper:
     """Scraper for GitHub trending repositories."""
     
@@ -17,12 +47,22 @@ class GitHubTrendingScraper:
     RAW_GITHUB_URL = "https://raw.githubusercontent.com"
     USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
     
-    # Default branch names to try for README
-    DEFAULT_BRANCHES = ['main', 'master']
+    # raw.githubusercontent.com resolves HEAD to the repository's default branch
+    README_REF = 'HEAD'
+    
+    # Bytes per network read fed to the HTML parser while the page downloads
+    PARSE_CHUNK_SIZE = 16384
+    
+    # Parsed trending pages are kept with their ETag so an unchanged page is not re-downloaded
+    CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'github-trending')
     
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({'User-Agent': self.USER_AGENT})
+        # README text per repository path, so reopening a README skips the network
+        self._readme_cache: Dict[str, str] = {}
+        # owner/repo slug per scraped repository URL, taken straight from the link href
+        self._repo_paths: Dict[str, str] = {}
     
     def get_trending_repos(self, date_range: str = "daily") -> List[Dict[str, str]]:
         """
@@ -35,14 +75,68 @@ class GitHubTrendingScraper:
             List of repository dictionaries with name, description, language, stars, etc.
         """
         params = self._build_params(date_range)
+        cached = self._load_cached_page(date_range)
+        headers = {'If-None-Match': cached['etag']} if cached else None
         
         try:
-            response = self.session.get(self.BASE_URL, params=params)
-            response.raise_for_status()
-            return self._parse_trending_page(response.text)
+            with self.session.get(self.BASE_URL, params=params, headers=headers, stream=True) as response:
+                if response.status_code == 304 and cached:
+                    return cached['repos']
+                response.raise_for_status()
+                # Parse while the rest of the page is still downloading
+                repos = self._parse_trending_page(
+                    response.iter_content(self.PARSE_CHUNK_SIZE),
+                    encoding=self._declared_encoding(response)
+                )
         except requests.RequestException as e:
             print(f"Error fetching trending repositories: {e}")
             return []
+        
+        etag = response.headers.get('ETag')
+        if etag and repos:
+            self._store_cached_page(date_range, etag, repos)
+        return repos
+    
+    @staticmethod
+    def _declared_encoding(response: requests.Response) -> str:
+        """Charset from the Content-Type header, else UTF-8 (what GitHub serves)."""
+        # requests reports ISO-8859-1 for any text/* response without a charset
+        if 'charset' in response.headers.get('Content-Type', '') and response.encoding:
+            return response.encoding
+        return 'utf-8'
+    
+    def _cache_path(self, date_range: str) -> str:
+        """Path of the cached trending page for a date range."""
+        return os.path.join(self.CACHE_DIR, f"{date_range}.json")
+    
+    def _load_cached_page(self, date_range: str) -> Optional[Dict]:
+        """Load the cached ETag and repositories for a date range, if usable."""
+        try:
+            with open(self._cache_path(date_range), encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict) or not isinstance(cached.get('etag'), str) or not cached['etag']:
+            return None
+        repos = cached.get('repos')
+        # Anything but a non-empty list of string-valued dicts is ignored and refetched
+        if not isinstance(repos, list) or not repos or not all(
+            isinstance(repo, dict) and all(isinstance(value, str) for value in repo.values())
+            for repo in repos
+        ):
+            return None
+        for repo in repos:
+            repo['language'] = sys.intern(repo.get('language', 'Unknown'))
+        return cached
+    
+    def _store_cached_page(self, date_range: str, etag: str, repos: List[Dict[str, str]]):
+        """Save the ETag and parsed repositories for a date range; caching is best effort."""
+        try:
+            os.makedirs(self.CACHE_DIR, exist_ok=True)
+            with open(self._cache_path(date_range), 'w', encoding='utf-8') as f:
+                json.dump({'etag': etag, 'repos': repos}, f, ensure_ascii=False)
+        except OSError:
+            pass
     
     def _build_params(self, date_range: str) -> Dict[str, str]:
         """Build URL parameters for the given date range."""
@@ -50,23 +144,37 @@ class GitHubTrendingScraper:
             return {"since": date_range}
         return {}  # daily is default
     
-    def _parse_trending_page(self, html: str) -> List[Dict[str, str]]:
-        """Parse the HTML content of the trending page."""
-        soup = BeautifulSoup(html, 'html.parser')
+    def _parse_trending_page(self, html: Union[str, Iterable[bytes]],
+                             encoding: Optional[str] = None) -> List[Dict[str, str]]:
+        """Parse the trending page, given as a string or as byte chunks in the given encoding."""
+        parser = etree.HTMLPullParser(events=('end',), tag='article', encoding=encoding)
         repos = []
         
-        repo_articles = soup.find_all('article', class_='Box-row')
+        for chunk in ([html] if isinstance(html, str) else html):
+            parser.feed(chunk)
+            self._collect_articles(parser.read_events(), repos)
+        try:
+            parser.close()
+        except etree.XMLSyntaxError:
+            # Raised for an empty page; there is nothing left to collect
+            return repos
+        self._collect_articles(parser.read_events(), repos)
         
-        for article in repo_articles:
+        return repos
+    
+    def _collect_articles(self, events, repos: List[Dict[str, str]]):
+        """Extract every completed repository article, freeing it once read."""
+        for _, article in events:
+            if 'Box-row' not in article.get('class', '').split():
+                continue
             try:
                 repo_info = self._extract_repo_info(article)
                 if repo_info:
                     repos.append(repo_info)
             except Exception:
                 # Skip malformed entries silently
-                continue
-        
-        return repos
+                pass
+            article.clear(keep_tail=True)
     
     def _extract_repo_info(self, article) -> Optional[Dict[str, str]]:
         """Extract repository information from an article element."""
@@ -86,61 +194,52 @@ class GitHubTrendingScraper:
     
     def _extract_name_and_url(self, article) -> tuple[Optional[str], Optional[str]]:
         """Extract repository name and URL."""
-        title_element = article.find('h2', class_='h3')
-        if not title_element:
-            return None, None
-            
-        link_element = title_element.find('a')
-        if not link_element:
+        links = _TITLE_LINK_XPATH(article)
+        if not links:
             return None, None
+        link_element = links[0]
             
         # Clean up the name: normalize whitespace and remove spaces around forward slash
-        name = link_element.get_text().strip()
-        name = re.sub(r'\s+', ' ', name)  # Replace multiple whitespace with single space
-        name = re.sub(r'\s*/\s*', '/', name)  # Remove spaces around forward slash
+        name = _element_text(link_element).strip()
+        name = ' '.join(name.split())  # Replace multiple whitespace with single space
+        name = _SLASH_SPACING_RE.sub('/', name)  # Remove spaces around forward slash
         
-        url = "https://github.com" + link_element.get('href', '')
+        href = link_element.get('href', '')
+        url = "https://github.com" + href
+        # The href is already the owner/repo slug README lookups need
+        self._repo_paths[url] = href.strip('/')
         return name, url
     
     def _extract_description(self, article) -> str:
         """Extract repository description."""
-        description_element = article.find('p', class_='col-9')
-        if description_element:
+        description_elements = _DESCRIPTION_XPATH(article)
+        if description_elements:
             # Clean up whitespace and newlines
-            description = re.sub(r'\s+', ' ', description_element.get_text().strip())
+            description = ' '.join(_element_text(description_elements[0]).split())
             return description
         return "No description"
     
     def _extract_language(self, article) -> str:
         """Extract programming language."""
-        language_element = article.find('span', {'itemprop': 'programmingLanguage'})
-        return language_element.get_text().strip() if language_element else "Unknown"
+        language_elements = _LANGUAGE_XPATH(article)
+        # Interned so the display's language lookups can match by identity
+        return sys.intern(_element_text(language_elements[0]).strip()) if language_elements else "Unknown"
     
     def _extract_stars(self, article) -> str:
         """Extract total stars count."""
-        stars_element = article.find('a', href=re.compile(r'/stargazers$'))
-        if stars_element:
-            return stars_element.get_text().strip().replace(',', '')
+        stars_elements = _STARGAZERS_XPATH(article)
+        if stars_elements:
+            return _element_text(stars_elements[0]).strip().replace(',', '')
         return "0"
     
     def _extract_stars_period(self, article) -> str:
         """Extract stars gained in the current period (today/this week/this month)."""
         # Look for the span that contains stars period text
         # The element has classes like "d-inline-block float-sm-right"
-        spans = article.find_all('span')
-        for span in spans:
-            span_text = span.get_text().strip()
-            # Match different time periods: "stars today", "stars this week", "stars this month"
-            period_patterns = [
-                r'(\d+(?:,\d+)*)\s+stars today',
-                r'(\d+(?:,\d+)*)\s+stars this week', 
-                r'(\d+(?:,\d+)*)\s+stars this month'
-            ]
-            
-            for pattern in period_patterns:
-                match = re.search(pattern, span_text)
-                if match:
-                    return match.group(1).replace(',', '')
+        for span in _SPANS_XPATH(article):
+            match = _STARS_PERIOD_RE.search(_element_text(span))
+            if match:
+                return match.group(1).replace(',', '')
         return "0"
     
     def get_readme(self, repo_url: str) -> str:
@@ -153,21 +252,30 @@ class GitHubTrendingScraper:
         Returns:
             README content as string
         """
-        repo_path = self._extract_repo_path(repo_url)
+        repo_path = self._repo_paths.get(repo_url) or self._extract_repo_path(repo_url)
         if not repo_path:
             return "Invalid repository URL."
         
-        # Try different branches
-        for branch in self.DEFAULT_BRANCHES:
-            readme_url = f"{self.RAW_GITHUB_URL}/{repo_path}/{branch}/README.md"
-            try:
-                response = self.session.get(readme_url)
-                if response.status_code == 200:
-                    return response.text
-            except requests.RequestException:
-                continue
+        if repo_path in self._readme_cache:
+            return self._readme_cache[repo_path]
         
-        return "README not found or not accessible."
+        text = self._fetch_text(self._readme_url(repo_path, self.README_REF))
+        if text is None:
+            return "README not found or not accessible."
+        self._readme_cache[repo_path] = text
+        return text
+    
+    def _readme_url(self, repo_path: str, ref: str) -> str:
+        """Raw URL of a repository's README.md at the given ref."""
+        return f"{self.RAW_GITHUB_URL}/{repo_path}/{ref}/README.md"
+    
+    def _fetch_text(self, url: str) -> Optional[str]:
+        """GET a URL, returning its body on 200 and None otherwise."""
+        try:
+            response = self.session.get(url)
+        except requests.RequestException:
+            return None
+        return response.text if response.status_code == 200 else None
     
     def _extract_repo_path(self, repo_url: str) -> Optional[str]:
         """Extract repository path from GitHub URL."""